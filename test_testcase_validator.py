@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unit tests for YamlSchemaValidator and the testcase_validator command line using Python's built-in unittest module.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+import testcase_validator
+from yaml_schema_validator import YamlSchemaValidator
+
+# iter_errors reports the nested type error first, while best_match prefers the shallower missing property
+SCHEMA = {
+    "type": "object",
+    "properties": {"a": {"type": "object", "properties": {"b": {"type": "integer"}}}},
+    "required": ["id"],
+}
+INVALID_YAML = "a:\n  b: x\n"
+FIRST_ERROR = "Validation Error: 'x' is not of type 'integer'"
+BEST_MATCH_ERROR = "Validation Error: 'id' is a required property"
+
+
+class _ValidatorTestCase(unittest.TestCase):
+    def setUp(self):
+        """Create a temporary directory with the schema file"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.schema_file = os.path.join(self.temp_dir, "schema.json")
+        with open(self.schema_file, "w") as f:
+            json.dump(SCHEMA, f)
+
+    def tearDown(self):
+        """Clean up temporary directory"""
+        shutil.rmtree(self.temp_dir)
+
+    def _write_yaml(self, filename, content):
+        yaml_file = os.path.join(self.temp_dir, filename)
+        with open(yaml_file, "w") as f:
+            f.write(content)
+        return yaml_file
+
+
+class TestValidateFailFast(_ValidatorTestCase):
+    """Tests for the fail_fast option of YamlSchemaValidator.validate"""
+
+    def _validate(self, **kwargs):
+        yaml_file = self._write_yaml("test.yml", INVALID_YAML)
+        validator = YamlSchemaValidator(Path(yaml_file), YamlSchemaValidator.load_json_schema(self.schema_file)[1])
+        validator.load_yaml()
+        output = StringIO()
+        with redirect_stdout(output):
+            result = validator.validate(**kwargs)
+        return result, output.getvalue()
+
+    def test_default_reports_best_match(self):
+        """Without fail_fast the most relevant error should be reported"""
+        result, output = self._validate()
+
+        self.assertFalse(result)
+        self.assertIn(BEST_MATCH_ERROR, output)
+        self.assertNotIn(FIRST_ERROR, output)
+
+    def test_fail_fast_reports_first_error(self):
+        """With fail_fast the first error found should be reported"""
+        result, output = self._validate(fail_fast=True)
+
+        self.assertFalse(result)
+        self.assertIn(FIRST_ERROR, output)
+        self.assertNotIn(BEST_MATCH_ERROR, output)
+
+
+class TestMain(_ValidatorTestCase):
+    """Tests for the testcase_validator command line"""
+
+    def _run_main(self, *args):
+        output = StringIO()
+        with mock.patch.object(sys, "argv", ["testcase_validator.py", *args]), redirect_stdout(output):
+            with self.assertRaises(SystemExit) as cm:
+                testcase_validator.main()
+        return cm.exception.code, output.getvalue()
+
+    def test_without_flag_reports_best_match(self):
+        """Without --fail-fast the most relevant error should be reported"""
+        yaml_file = self._write_yaml("test.yml", INVALID_YAML)
+
+        code, output = self._run_main(self.schema_file, yaml_file)
+
+        self.assertEqual(code, 1)
+        self.assertIn(BEST_MATCH_ERROR, output)
+
+    def test_fail_fast_flag_is_accepted_anywhere(self):
+        """--fail-fast should be stripped from the arguments wherever it appears"""
+        yaml_file = self._write_yaml("test.yml", INVALID_YAML)
+        positions = {
+            "first": ["--fail-fast", self.schema_file, yaml_file],
+            "middle": [self.schema_file, "--fail-fast", yaml_file],
+            "last": [self.schema_file, yaml_file, "--fail-fast"],
+        }
+        for position, args in positions.items():
+            with self.subTest(position=position):
+                code, output = self._run_main(*args)
+
+                self.assertEqual(code, 1)
+                self.assertIn(f"Validating: {yaml_file}", output)
+                self.assertIn(FIRST_ERROR, output)
+                self.assertNotIn(BEST_MATCH_ERROR, output)
+
+    def test_fail_fast_flag_alone_does_not_count_as_a_file(self):
+        """--fail-fast should not stand in for the schema or test case argument"""
+        code, output = self._run_main("--fail-fast", self.schema_file)
+
+        self.assertEqual(code, 1)
+        self.assertIn("Usage:", output)
+
+    def test_reports_every_file_and_fails_if_any_fails(self):
+        """Every file should be reported even after a failure, and the exit status should be 1"""
+        first = self._write_yaml("first.yml", "id: 1\n")
+        invalid = self._write_yaml("invalid.yml", INVALID_YAML)
+        last = self._write_yaml("last.yml", "id: 2\n")
+
+        code, output = self._run_main(self.schema_file, first, invalid, last)
+
+        self.assertEqual(code, 1)
+        for yaml_file in (first, invalid, last):
+            self.assertIn(f"Validating: {yaml_file}", output)
+        self.assertIn(f"File '{invalid}' contains schema violations.", output)
+        self.assertIn(f"File '{last}' is valid according to the test case schema.", output)
+
+    def test_exits_zero_when_all_files_pass(self):
+        """The exit status should be 0 when every file is valid"""
+        first = self._write_yaml("first.yml", "id: 1\n")
+        second = self._write_yaml("second.yml", "id: 2\n")
+
+        code, output = self._run_main(self.schema_file, first, second)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(output.count("✓ Validation successful"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -8,6 +8,7 @@ import os
 import shutil
 import tempfile
 import unittest
+from unittest import mock
 
 from yaml_reindenter import YamlReindenter
 
@@ -585,6 +586,23 @@ class TestReindent(unittest.TestCase):
 
         self.assertEqual(reindenter.lines[1], "  content")
 
+    def test_uses_given_issues_without_reanalyzing(self):
+        """Should fix the issues passed in instead of analyzing again"""
+        yaml_content = "key: |\n    content"
+        yaml_file = os.path.join(self.temp_dir, "test.yml")
+        with open(yaml_file, "w") as f:
+            f.write(yaml_content)
+
+        reindenter = YamlReindenter(yaml_file)
+        reindenter.load_file()
+        issues = reindenter.analyze()
+        with mock.patch.object(reindenter, "analyze") as analyze:
+            result = reindenter.reindent(issues)
+
+        self.assertTrue(result)
+        analyze.assert_not_called()
+        self.assertEqual(reindenter.lines[1], "  content")
+
 
 class TestSaveFile(unittest.TestCase):
     """Tests for save_file method"""
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Unit tests for YamlSchemaValidator schema loading and validator caching using Python's built-in unittest module.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+from yaml_schema_validator import YamlSchemaValidator, _compiled_validator
+
+SCHEMA = {"type": "object", "properties": {"id": {"type": "integer"}}, "required": ["id"]}
+
+
+class TestSchemaCache(unittest.TestCase):
+    """Tests for load_json_schema and the compiled validator cache"""
+
+    def setUp(self):
+        """Create a temporary directory with a valid test case file and start from an empty validator cache"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.yaml_file = Path(self.temp_dir, "test.yml")
+        self.yaml_file.write_text("id: 1\n")
+        _compiled_validator.cache_clear()
+
+    def tearDown(self):
+        """Clean up temporary directory"""
+        shutil.rmtree(self.temp_dir)
+
+    def _write_schema(self, filename, schema=SCHEMA):
+        schema_file = os.path.join(self.temp_dir, filename)
+        with open(schema_file, "w") as f:
+            json.dump(schema, f)
+        return schema_file
+
+    def _validate(self, schema):
+        validator = YamlSchemaValidator(self.yaml_file, schema)
+        validator.load_yaml()
+        output = StringIO()
+        with redirect_stdout(output):
+            result = validator.validate()
+        return result, output.getvalue()
+
+    def test_load_returns_an_independent_schema_per_call(self):
+        """Changing a loaded schema should not affect another load of the same content"""
+        ok, schema = YamlSchemaValidator.load_json_schema(self._write_schema("first.json"))
+        self.assertTrue(ok)
+        schema["required"] = ["zzz"]
+
+        ok, other = YamlSchemaValidator.load_json_schema(self._write_schema("second.json"))
+
+        self.assertTrue(ok)
+        self.assertEqual(other, SCHEMA)
+
+    def test_identical_content_shares_one_validator(self):
+        """Schemas with the same content loaded from different files should compile once"""
+        first = YamlSchemaValidator.load_json_schema(self._write_schema("first.json"))[1]
+        second = YamlSchemaValidator.load_json_schema(self._write_schema("second.json"))[1]
+
+        self.assertTrue(self._validate(first)[0])
+        self.assertTrue(self._validate(second)[0])
+
+        info = _compiled_validator.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+    def test_validator_is_reused_across_calls(self):
+        """Repeated validations against one schema should reuse its compiled validator"""
+        schema = YamlSchemaValidator.load_json_schema(self._write_schema("schema.json"))[1]
+
+        for _ in range(3):
+            self.assertTrue(self._validate(schema)[0])
+
+        info = _compiled_validator.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+    def test_changed_schema_is_checked_again(self):
+        """A schema edited after a successful validation should be checked against the metaschema again"""
+        schema = YamlSchemaValidator.load_json_schema(self._write_schema("schema.json"))[1]
+        self.assertTrue(self._validate(schema)[0])
+
+        schema["type"] = 12
+        result, output = self._validate(schema)
+
+        self.assertFalse(result)
+        self.assertIn("Schema Error:", output)
+
+    def test_invalid_schema_file_reports_schema_error(self):
+        """A schema that fails the metaschema check should load, then be reported on every validation"""
+        ok, schema = YamlSchemaValidator.load_json_schema(self._write_schema("invalid.json", {"type": 12}))
+        self.assertTrue(ok)
+
+        for _ in range(2):
+            result, output = self._validate(schema)
+
+            self.assertFalse(result)
+            self.assertIn("Schema Error:", output)
+        self.assertEqual(_compiled_validator.cache_info().currsize, 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -6,16 +6,21 @@ from yaml_schema_validator import YamlSchemaValidator
 
 
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: python testcase_validator.py json_schema.json testcase.yml")
+    args = sys.argv[1:]
+    fail_fast = "--fail-fast" in args
+    if fail_fast:
+        args.remove("--fail-fast")
+    if len(args) < 2:
+        print("Usage: python testcase_validator.py [--fail-fast] json_schema.json testcase.yml [testcase.yml ...]")
         sys.exit(1)
-    path_ = Path(sys.argv[1])
+    path_ = Path(args[0])
     json_schema = YamlSchemaValidator.load_json_schema(path_)[1]
 
-    yaml_file = sys.argv[2]
-    validator = YamlSchemaValidator(Path(yaml_file), json_schema)
-    success = validator.validate_and_report()
-    sys.exit(0 if success else 1)
+    # Every file is validated and reported, even after a failure; they all share the schema's cached validator
+    results = [
+        YamlSchemaValidator(Path(yaml_file), json_schema).validate_and_report(fail_fast) for yaml_file in args[1:]
+    ]
+    sys.exit(0 if all(results) else 1)
 
 
 if __name__ == "__main__":
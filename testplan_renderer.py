@@ -6,7 +6,7 @@ import json
 import os
 import sys
 from abc import ABC
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -14,7 +14,7 @@ import yaml
 from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template
 from typing_extensions import override
 
-from yaml_schema_validator import YamlSchemaValidator
+from yaml_schema_validator import YamlLoader, YamlSchemaValidator
 
 
 class GenericTestPlanRenderer(ABC):
@@ -22,15 +22,22 @@ class GenericTestPlanRenderer(ABC):
         self.input_file = input_file
         self.payload = None
 
+    @classmethod
+    def from_payload(cls, payload, input_file=None):
+        """Build a renderer around an already-parsed payload, skipping the file round trip of load_payload()."""
+        renderer = cls(input_file)
+        renderer.payload = payload
+        return renderer
+
     def load_payload(self):
         file_path = self.input_file
         file_path_name = self.input_file.__str__()
         try:
-            with open(file_path) as f:
+            with open(file_path, "rb") as f:
                 if file_path_name.endswith(".json"):
-                    self.payload = json.load(f)
+                    self.payload = json.loads(f.read())
                 elif file_path_name.endswith((".yaml", ".yml")):
-                    self.payload = yaml.safe_load(f)
+                    self.payload = yaml.load(f, Loader=YamlLoader)
                 else:
                     print(f"Error: Unsupported file format '{file_path_name}'")
                     return False
@@ -72,15 +79,10 @@ class GenericTestPlanRenderer(ABC):
                 if not template_file.exists():
                     print(f"Error: Template file '{template_path}' not found")
                     return False
-                env = Environment(
-                    loader=FileSystemLoader(template_file.parent),
-                    undefined=StrictUndefined,
-                )
-                # Expose helper to templates
-                env.globals["read_file"] = self._make_partial(TestCaseRenderer.read_file_safe, template_file.parent)
+                env = _template_environment(template_file.parent)
                 template = env.get_template(template_file.name)
             elif template_string:
-                template = Template(template_string)
+                template = _compile_template_string(template_string)
             else:
                 print("Error: No template provided")
                 return False
@@ -103,6 +105,29 @@ class GenericTestPlanRenderer(ABC):
         pass
 
 
+@lru_cache(maxsize=None)
+def _template_environment(template_dir: Path) -> Environment:
+    """Return one Jinja2 environment per template directory, so repeated renders reuse compiled templates."""
+    env = Environment(
+        loader=FileSystemLoader(template_dir),
+        undefined=StrictUndefined,
+    )
+    # Expose helper to templates
+    env.globals["read_file"] = GenericTestPlanRenderer._make_partial(
+        GenericTestPlanRenderer.read_file_safe, template_dir
+    )
+    return env
+
+
+_STRING_TEMPLATE_ENVIRONMENT = Environment()
+
+
+@lru_cache(maxsize=128)
+def _compile_template_string(template_string: str) -> Template:
+    """Compile an inline template once; identical template strings reuse the compiled template."""
+    return _STRING_TEMPLATE_ENVIRONMENT.from_string(template_string)
+
+
 class TestCaseRenderer(GenericTestPlanRenderer):
     @override
     def _actual_render(self, template: Template) -> str:
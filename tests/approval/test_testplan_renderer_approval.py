@@ -2,10 +2,15 @@
 import json
 import os
 import shutil
-import subprocess
 import sys
 import tempfile
+import traceback
 import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
 import approvaltests.approvals
 import yaml
@@ -13,66 +18,33 @@ from approvaltests import verify
 from approvaltests.namer import NamerFactory
 from approvaltests.reporters import PythonNativeReporter
 
-
-class TestPlanRendererGsmaApprovalTests(unittest.TestCase):
-    """End-to-end approval tests for testplan_renderer.py CLI."""
-
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.maxDiff = None
-        approvaltests.approvals.set_default_reporter(PythonNativeReporter())
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-
-    def _run_cli(self, *args):
-        result = self._run_cli_result(*args)
-        return f"""\
-Result code: {result.returncode}
-Standard Output (starting on the new line):
-{result.stdout}
-Standard Error (starting on the new line):
-{result.stderr}"""
-
-    def _run_cli_result(self, *args):
-        """Run testplan_renderer.py CLI and return stdout, stderr, and return code."""
-        cmd = [sys.executable, "testplan_renderer.py"] + list(args)
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result
-
-    def _create_container_schema(self, filename="container_schema.json"):
-        """Create a container schema file in temp directory."""
-        schema = {
-            "$schema": "http://json-schema.org/draft-04/schema#",
-            "type": "object",
-            "properties": {
-                "date": {"type": "string"},
-                "product": {"type": "string"},
-                "description": {"type": "string"},
-            },
-            "required": ["date", "product", "description"],
-        }
-        filepath = os.path.join(self.temp_dir, filename)
-        with open(filepath, "w") as f:
-            json.dump(schema, f, indent=2)
-        return filepath
-
-    def _create_container_data(self, filename="container_data.yml", **kwargs):
-        """Create a container data file in temp directory."""
-        data = {
-            "date": kwargs.get("date", "2024-01-01"),
-            "product": kwargs.get("product", "Test Product"),
-            "description": kwargs.get("description", "Test Description"),
-        }
-        filepath = os.path.join(self.temp_dir, filename)
-        with open(filepath, "w") as f:
-            yaml.dump(data, f)
-        return filepath
-
-    def _create_container_template(self, filename="container_template.j2", content=None):
-        """Create a container template file in temp directory."""
-        if content is None:
-            content = """# Test Document
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+from testplan_renderer import TestCaseRenderer as _TestCaseRenderer  # noqa: E402
+from testplan_renderer import _compile_template_string  # noqa: E402
+from testplan_renderer import main as _cli_main  # noqa: E402
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
+
+# Static fixture contents, encoded once at import
+_CONTAINER_SCHEMA_JSON = json.dumps(
+    {
+        "$schema": "http://json-schema.org/draft-04/schema#",
+        "type": "object",
+        "properties": {
+            "date": {"type": "string"},
+            "product": {"type": "string"},
+            "description": {"type": "string"},
+        },
+        "required": ["date", "product", "description"],
+    }
+).encode()
+
+_CONTAINER_TEMPLATE = """# Test Document
 
 Product: {{ container.product }}
 Date: {{ container.date }}
@@ -81,37 +53,26 @@ Date: {{ container.date }}
 
 ---
 {{ container.description }}
-"""
-        filepath = os.path.join(self.temp_dir, filename)
-        with open(filepath, "w") as f:
-            f.write(content)
-        return filepath
-
-    def _create_test_case_schema(self, filename="testcase_schema.json"):
-        """Create a test case schema file in temp directory."""
-        schema = {
-            "$schema": "http://json-schema.org/draft-04/schema#",
-            "type": "object",
-            "properties": {
-                "requirement": {"type": "string"},
-                "item": {"type": "integer"},
-                "tc": {"type": "integer"},
-                "id": {"type": "string"},
-                "description": {"type": "string"},
-                "initial_conditions": {"type": "object"},
-                "test_sequences": {"type": "array"},
-            },
-            "required": ["requirement", "item", "tc", "id", "description"],
-        }
-        filepath = os.path.join(self.temp_dir, filename)
-        with open(filepath, "w") as f:
-            json.dump(schema, f, indent=2)
-        return filepath
-
-    def _create_test_case_template(self, filename="testcase_template.j2", content=None):
-        """Create a test case template file in temp directory."""
-        if content is None:
-            content = """\
+""".encode()
+
+_TEST_CASE_SCHEMA_JSON = json.dumps(
+    {
+        "$schema": "http://json-schema.org/draft-04/schema#",
+        "type": "object",
+        "properties": {
+            "requirement": {"type": "string"},
+            "item": {"type": "integer"},
+            "tc": {"type": "integer"},
+            "id": {"type": "string"},
+            "description": {"type": "string"},
+            "initial_conditions": {"type": "object"},
+            "test_sequences": {"type": "array"},
+        },
+        "required": ["requirement", "item", "tc", "id", "description"],
+    }
+).encode()
+
+_TEST_CASE_TEMPLATE = """\
 # {{ toc_entry }} Test Case: {{ tc.id }}
 
 **Requirement**: {{ tc.requirement }}
@@ -146,26 +107,164 @@ Date: {{ container.date }}
 {% endfor %}
 {% endfor %}
 {%- endif -%}
-"""
-        filepath = os.path.join(self.temp_dir, filename)
+""".encode()
+
+
+class TestPlanRendererGsmaApprovalTests(unittest.TestCase):
+    """End-to-end approval tests for testplan_renderer.py CLI."""
+
+    @classmethod
+    def setUpClass(cls):
+        # One scratch tree per class: read-only fixtures at the top, one subdirectory per test
+        cls._class_dir = Path(tempfile.mkdtemp())
+        cls._fixture_files = set()
+        approvaltests.approvals.set_default_reporter(PythonNativeReporter())
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._class_dir, ignore_errors=True)
+
+    def setUp(self):
+        self.temp_dir = self._class_dir / self._testMethodName
+        self.temp_dir.mkdir()
+
+    def _run_cli(self, *args):
+        result = self._run_cli_result(*args)
+        return f"""\
+Result code: {result.returncode}
+Standard Output (starting on the new line):
+{result.stdout}
+Standard Error (starting on the new line):
+{result.stderr}"""
+
+    def _run_cli_result(self, *args):
+        """Run the testplan_renderer.py entry point in-process and return stdout, stderr, return code and -o output."""
+        stdout, stderr = StringIO(), StringIO()
+        # argparse wraps its usage text to the terminal width; pin the 80 columns a piped subprocess would see
+        with mock.patch.dict(os.environ, {"COLUMNS": "80"}), redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                _cli_main([os.fspath(arg) for arg in args])
+                returncode = 0
+            except SystemExit as e:
+                # Mirror the interpreter: None exits 0, other non-int codes are printed to stderr and exit 1
+                if e.code is None:
+                    returncode = 0
+                elif isinstance(e.code, int):
+                    returncode = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+        output_content = None
+        if "-o" in args:
+            output_file = Path(args[args.index("-o") + 1])
+            if output_file.exists():
+                output_content = output_file.read_text(encoding="utf-8")
+        return SimpleNamespace(
+            returncode=returncode, stdout=stdout.getvalue(), stderr=stderr.getvalue(), output_content=output_content
+        )
+
+    @classmethod
+    def _create_container_schema(cls, filename="container_schema.json"):
+        """Create a container schema file once per class and return its path."""
+        filepath = cls._class_dir / filename
+        if filepath in cls._fixture_files:
+            return filepath
+        filepath.write_bytes(_CONTAINER_SCHEMA_JSON)
+        cls._fixture_files.add(filepath)
+        return filepath
+
+    def _create_container_data(self, filename="container_data.yml", **kwargs):
+        """Create a container data file in temp directory."""
+        data = {
+            "date": kwargs.get("date", "2024-01-01"),
+            "product": kwargs.get("product", "Test Product"),
+            "description": kwargs.get("description", "Test Description"),
+        }
+        filepath = self.temp_dir / filename
         with open(filepath, "w") as f:
-            f.write(content)
+            yaml.dump(data, f, Dumper=YamlDumper)
+        return filepath
+
+    def _create_container_template(self, filename="container_template.j2", content=None):
+        """Create a container template file in temp directory."""
+        filepath = self.temp_dir / filename
+        if content is None:
+            filepath.write_bytes(_CONTAINER_TEMPLATE)
+        else:
+            filepath.write_text(content)
+        return filepath
+
+    @classmethod
+    def _create_test_case_schema(cls, filename="testcase_schema.json"):
+        """Create a test case schema file once per class and return its path."""
+        filepath = cls._class_dir / filename
+        if filepath in cls._fixture_files:
+            return filepath
+        filepath.write_bytes(_TEST_CASE_SCHEMA_JSON)
+        cls._fixture_files.add(filepath)
+        return filepath
+
+    @classmethod
+    def _create_test_case_template(cls, filename="testcase_template.j2"):
+        """Create a test case template file once per class and return its path."""
+        filepath = cls._class_dir / filename
+        if filepath in cls._fixture_files:
+            return filepath
+        filepath.write_bytes(_TEST_CASE_TEMPLATE)
+        cls._fixture_files.add(filepath)
         return filepath
 
     def _create_test_case_data(self, filename, data):
         """Create a test case YAML file in temp directory."""
-        filepath = os.path.join(self.temp_dir, filename)
+        filepath = self.temp_dir / filename
         with open(filepath, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True)
         return filepath
 
     def _setup_test_plan_md_placeholder(self, template_dir):
         """Create placeholder test_plan.md file for container template."""
-        filepath = os.path.join(template_dir, "test_plan.md")
-        with open(filepath, "w") as f:
-            f.write("")
+        filepath = Path(template_dir, "test_plan.md")
+        # main() replaces this file before rendering, so it only has to exist
+        filepath.touch()
         return filepath
 
+    def _render_test_case(self, filename, testcase, output_name="output.md", **container_kwargs):
+        """Render one test case file with the default schemas and templates, writing the result to output_name."""
+        container_schema = self._create_container_schema()
+        container_data = self._create_container_data(**container_kwargs)
+        container_template = self._create_container_template()
+
+        testcase_schema = self._create_test_case_schema()
+        testcase_template = self._create_test_case_template()
+        testcase_file = self._create_test_case_data(filename, testcase)
+
+        self._setup_test_plan_md_placeholder(self.temp_dir)
+        output_file = self.temp_dir / output_name
+
+        return self._run_cli_result(
+            "-o",
+            output_file,
+            "--container",
+            container_schema,
+            container_template,
+            container_data,
+            "--test-case",
+            testcase_schema,
+            testcase_template,
+            testcase_file,
+        )
+
+    def _verify_rendered_test_case(self, label, filename, testcase, **container_kwargs):
+        """Render one test case file and verify the output against the approved file for label."""
+        result = self._render_test_case(filename, testcase, **container_kwargs)
+        verify(
+            f"Return Code: {result.returncode}\n\nOutput File:\n{result.output_content}\n\nStderr:\n{result.stderr}",
+            namer=NamerFactory.with_parameters(label).namer,
+        )
+
     def test_render_with_real_gsma_data(self):
         """Test rendering with real GSMA dataset."""
         self._setup_test_plan_md_placeholder("data/container")
@@ -209,13 +308,6 @@ Date: {{ container.date }}
 
     def test_render_minimal_test_case(self):
         """Test rendering with minimal test case data."""
-        container_schema = self._create_container_schema()
-        container_data = self._create_container_data()
-        container_template = self._create_container_template()
-
-        testcase_schema = self._create_test_case_schema()
-        testcase_template = self._create_test_case_template()
-
         minimal_testcase = {
             "requirement": "REQ001",
             "item": 1,
@@ -223,45 +315,10 @@ Date: {{ container.date }}
             "id": "1.1.1",
             "description": "Minimal test case",
         }
-        testcase_file = self._create_test_case_data("minimal_tc.yml", minimal_testcase)
-
-        self._setup_test_plan_md_placeholder(self.temp_dir)
-        output_file = os.path.join(self.temp_dir, "output.md")
-
-        result = self._run_cli_result(
-            "-o",
-            output_file,
-            "--container",
-            container_schema,
-            container_template,
-            container_data,
-            "--test-case",
-            testcase_schema,
-            testcase_template,
-            testcase_file,
-        )
-
-        with open(output_file) as f:
-            output_content = f.read()
-
-        verify(
-            f"Return Code: {result.returncode}\n\nOutput File:\n{output_content}\n\nStderr:\n{result.stderr}",
-            namer=NamerFactory.with_parameters("minimal").namer,
-        )
+        self._verify_rendered_test_case("minimal", "minimal_tc.yml", minimal_testcase)
 
     def test_render_with_unicode_characters(self):
         """Test rendering with unicode and special characters."""
-        container_schema = self._create_container_schema()
-        container_data = self._create_container_data(
-            product="测试产品 🚀",
-            date="2024-01-01",
-            description="Тестовое описание with émojis 😊",
-        )
-        container_template = self._create_container_template()
-
-        testcase_schema = self._create_test_case_schema()
-        testcase_template = self._create_test_case_template()
-
         unicode_testcase = {
             "requirement": "РЕК001",
             "item": 1,
@@ -285,41 +342,17 @@ Date: {{ container.date }}
                 }
             ],
         }
-        testcase_file = self._create_test_case_data("unicode_tc.yml", unicode_testcase)
-
-        self._setup_test_plan_md_placeholder(self.temp_dir)
-        output_file = os.path.join(self.temp_dir, "output.md")
-
-        result = self._run_cli_result(
-            "-o",
-            output_file,
-            "--container",
-            container_schema,
-            container_template,
-            container_data,
-            "--test-case",
-            testcase_schema,
-            testcase_template,
-            testcase_file,
-        )
-
-        with open(output_file, encoding="utf-8") as f:
-            output_content = f.read()
-
-        verify(
-            f"Return Code: {result.returncode}\n\nOutput File:\n{output_content}\n\nStderr:\n{result.stderr}",
-            namer=NamerFactory.with_parameters("unicode").namer,
+        self._verify_rendered_test_case(
+            "unicode",
+            "unicode_tc.yml",
+            unicode_testcase,
+            product="测试产品 🚀",
+            date="2024-01-01",
+            description="Тестовое описание with émojis 😊",
         )
 
     def test_render_with_empty_test_sequences(self):
         """Test rendering with empty test sequences."""
-        container_schema = self._create_container_schema()
-        container_data = self._create_container_data()
-        container_template = self._create_container_template()
-
-        testcase_schema = self._create_test_case_schema()
-        testcase_template = self._create_test_case_template()
-
         empty_sequences_testcase = {
             "requirement": "REQ002",
             "item": 2,
@@ -328,41 +361,10 @@ Date: {{ container.date }}
             "description": "Test case with empty sequences",
             "test_sequences": [],
         }
-        testcase_file = self._create_test_case_data("empty_sequences_tc.yml", empty_sequences_testcase)
-
-        self._setup_test_plan_md_placeholder(self.temp_dir)
-        output_file = os.path.join(self.temp_dir, "output.md")
-
-        result = self._run_cli_result(
-            "-o",
-            output_file,
-            "--container",
-            container_schema,
-            container_template,
-            container_data,
-            "--test-case",
-            testcase_schema,
-            testcase_template,
-            testcase_file,
-        )
-
-        with open(output_file) as f:
-            output_content = f.read()
-
-        verify(
-            f"Return Code: {result.returncode}\n\nOutput File:\n{output_content}\n\nStderr:\n{result.stderr}",
-            namer=NamerFactory.with_parameters("empty_sequences").namer,
-        )
+        self._verify_rendered_test_case("empty_sequences", "empty_sequences_tc.yml", empty_sequences_testcase)
 
     def test_render_with_missing_optional_fields(self):
         """Test rendering with missing optional fields."""
-        container_schema = self._create_container_schema()
-        container_data = self._create_container_data()
-        container_template = self._create_container_template()
-
-        testcase_schema = self._create_test_case_schema()
-        testcase_template = self._create_test_case_template()
-
         missing_fields_testcase = {
             "requirement": "REQ003",
             "item": 3,
@@ -370,41 +372,10 @@ Date: {{ container.date }}
             "id": "3.3.3",
             "description": "Test case with missing optional fields",
         }
-        testcase_file = self._create_test_case_data("missing_fields_tc.yml", missing_fields_testcase)
-
-        self._setup_test_plan_md_placeholder(self.temp_dir)
-        output_file = os.path.join(self.temp_dir, "output.md")
-
-        result = self._run_cli_result(
-            "-o",
-            output_file,
-            "--container",
-            container_schema,
-            container_template,
-            container_data,
-            "--test-case",
-            testcase_schema,
-            testcase_template,
-            testcase_file,
-        )
-
-        with open(output_file) as f:
-            output_content = f.read()
-
-        verify(
-            f"Return Code: {result.returncode}\n\nOutput File:\n{output_content}\n\nStderr:\n{result.stderr}",
-            namer=NamerFactory.with_parameters("missing_fields").namer,
-        )
+        self._verify_rendered_test_case("missing_fields", "missing_fields_tc.yml", missing_fields_testcase)
 
     def test_render_complex_nested_structure(self):
         """Test rendering with complex nested data structures."""
-        container_schema = self._create_container_schema()
-        container_data = self._create_container_data(product="Complex Product", description="Complex test")
-        container_template = self._create_container_template()
-
-        testcase_schema = self._create_test_case_schema()
-        testcase_template = self._create_test_case_template()
-
         complex_testcase = {
             "requirement": "REQ_COMPLEX",
             "item": 10,
@@ -457,32 +428,8 @@ Date: {{ container.date }}
                 },
             ],
         }
-        testcase_file = self._create_test_case_data("complex_tc.yml", complex_testcase)
-
-        self._setup_test_plan_md_placeholder(self.temp_dir)
-        output_file = os.path.join(self.temp_dir, "output.md")
-
-        result = self._run_cli_result(
-            "-o",
-            output_file,
-            "--container",
-            container_schema,
-            container_template,
-            container_data,
-            "--test-case",
-            testcase_schema,
-            testcase_template,
-            testcase_file,
-        )
-
-        print(result.stdout)
-
-        with open(output_file) as f:
-            output_content = f.read()
-
-        verify(
-            f"Return Code: {result.returncode}\n\nOutput File:\n{output_content}\n\nStderr:\n{result.stderr}",
-            namer=NamerFactory.with_parameters("complex").namer,
+        self._verify_rendered_test_case(
+            "complex", "complex_tc.yml", complex_testcase, product="Complex Product", description="Complex test"
         )
 
     def test_error_missing_container_argument(self):
@@ -516,9 +463,8 @@ Date: {{ container.date }}
         testcase_schema = self._create_test_case_schema()
         testcase_template = self._create_test_case_template()
 
-        invalid_yaml = os.path.join(self.temp_dir, "invalid.yml")
-        with open(invalid_yaml, "w") as f:
-            f.write("invalid: yaml: [unclosed")
+        invalid_yaml = self.temp_dir / "invalid.yml"
+        invalid_yaml.write_text("invalid: yaml: [unclosed")
 
         self._setup_test_plan_md_placeholder(self.temp_dir)
 
@@ -542,9 +488,9 @@ Date: {{ container.date }}
         """Test error handling when data doesn't match schema."""
         container_schema = self._create_container_schema()
         # Create data missing required fields
-        invalid_container_data = os.path.join(self.temp_dir, "invalid_data.yml")
+        invalid_container_data = self.temp_dir / "invalid_data.yml"
         with open(invalid_container_data, "w") as f:
-            yaml.dump({"date": "2024-01-01"}, f)  # Missing required 'product' and 'description'
+            yaml.dump({"date": "2024-01-01"}, f, Dumper=YamlDumper)  # Missing required 'product' and 'description'
 
         container_template = self._create_container_template()
 
@@ -589,13 +535,6 @@ Date: {{ container.date }}
 
     def test_render_to_output_file(self):
         """Test rendering output to a specified file."""
-        container_schema = self._create_container_schema()
-        container_data = self._create_container_data()
-        container_template = self._create_container_template()
-
-        testcase_schema = self._create_test_case_schema()
-        testcase_template = self._create_test_case_template()
-
         testcase = {
             "requirement": "REQ_OUTPUT",
             "item": 5,
@@ -618,48 +557,20 @@ Date: {{ container.date }}
                 }
             ],
         }
-        testcase_file = self._create_test_case_data("output_tc.yml", testcase)
-
-        self._setup_test_plan_md_placeholder(self.temp_dir)
-        output_file = os.path.join(self.temp_dir, "custom_output.md")
-
-        result = self._run_cli_result(
-            "-o",
-            output_file,
-            "--container",
-            container_schema,
-            container_template,
-            container_data,
-            "--test-case",
-            testcase_schema,
-            testcase_template,
-            testcase_file,
-        )
+        result = self._render_test_case("output_tc.yml", testcase, output_name="custom_output.md")
+        output_file = self.temp_dir / "custom_output.md"
 
         print(result.stdout)
 
-        self.assertTrue(os.path.exists(output_file))
-
-        with open(output_file) as f:
-            output_content = f.read()
+        self.assertTrue(output_file.exists())
 
         verify(
-            f"Return Code: {result.returncode}\n\nFile exists: {os.path.exists(output_file)}\n\nOutput File:\n{output_content}\n\nStderr:\n{result.stderr}",
+            f"Return Code: {result.returncode}\n\nFile exists: {output_file.exists()}\n\nOutput File:\n{result.output_content}\n\nStderr:\n{result.stderr}",
             namer=NamerFactory.with_parameters("output_file").namer,
         )
 
     def test_render_with_special_characters_in_descriptions(self):
         """Test rendering with special characters like <, >, &, quotes in descriptions."""
-        container_schema = self._create_container_schema()
-        container_data = self._create_container_data(
-            product='Product with <tags> & "quotes"',
-            description="Description with 'apostrophes' and <html> tags",
-        )
-        container_template = self._create_container_template()
-
-        testcase_schema = self._create_test_case_schema()
-        testcase_template = self._create_test_case_template()
-
         special_chars_testcase = {
             "requirement": "REQ<001>",
             "item": 6,
@@ -685,51 +596,16 @@ Date: {{ container.date }}
                 }
             ],
         }
-        testcase_file = self._create_test_case_data("special_chars_tc.yml", special_chars_testcase)
-
-        self._setup_test_plan_md_placeholder(self.temp_dir)
-        output_file = os.path.join(self.temp_dir, "output.md")
-
-        result = self._run_cli_result(
-            "-o",
-            output_file,
-            "--container",
-            container_schema,
-            container_template,
-            container_data,
-            "--test-case",
-            testcase_schema,
-            testcase_template,
-            testcase_file,
-        )
-
-        with open(output_file) as f:
-            output_content = f.read()
-
-        verify(
-            f"Return Code: {result.returncode}\n\nOutput File:\n{output_content}\n\nStderr:\n{result.stderr}",
-            namer=NamerFactory.with_parameters("special_chars").namer,
+        self._verify_rendered_test_case(
+            "special_chars",
+            "special_chars_tc.yml",
+            special_chars_testcase,
+            product='Product with <tags> & "quotes"',
+            description="Description with 'apostrophes' and <html> tags",
         )
 
     def test_render_with_multiline_descriptions(self):
         """Test rendering with multi-line descriptions."""
-        container_schema = self._create_container_schema()
-        container_data = self._create_container_data(
-            description="""This is a multi-line description.
-
-It contains multiple paragraphs.
-
-- Bullet point 1
-- Bullet point 2
-- Bullet point 3
-
-And some final text."""
-        )
-        container_template = self._create_container_template()
-
-        testcase_schema = self._create_test_case_schema()
-        testcase_template = self._create_test_case_template()
-
         multiline_testcase = {
             "requirement": "REQ_MULTILINE",
             "item": 7,
@@ -764,32 +640,81 @@ Each step is important.""",
                 }
             ],
         }
-        testcase_file = self._create_test_case_data("multiline_tc.yml", multiline_testcase)
+        self._verify_rendered_test_case(
+            "multiline",
+            "multiline_tc.yml",
+            multiline_testcase,
+            description="""This is a multi-line description.
 
-        self._setup_test_plan_md_placeholder(self.temp_dir)
-        output_file = os.path.join(self.temp_dir, "output.md")
+It contains multiple paragraphs.
 
-        result = self._run_cli_result(
-            "-o",
-            output_file,
-            "--container",
-            container_schema,
-            container_template,
-            container_data,
-            "--test-case",
-            testcase_schema,
-            testcase_template,
-            testcase_file,
+- Bullet point 1
+- Bullet point 2
+- Bullet point 3
+
+And some final text.""",
         )
 
-        with open(output_file) as f:
-            output_content = f.read()
 
-        verify(
-            f"Return Code: {result.returncode}\n\nOutput File:\n{output_content}\n\nStderr:\n{result.stderr}",
-            namer=NamerFactory.with_parameters("multiline").namer,
+class TestPlanRendererUnitTests(unittest.TestCase):
+    """Unit tests for the renderer classes, without going through the CLI."""
+
+    def setUp(self):
+        self.temp_dir = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.testcase_template = self.temp_dir / "testcase_template.j2"
+        self.testcase_template.write_bytes(_TEST_CASE_TEMPLATE)
+
+    def test_render_from_in_memory_payload(self):
+        """Test that a renderer built from an in-memory payload renders the same as one loaded from the file."""
+        testcase = {
+            "requirement": "REQ_PAYLOAD",
+            "item": 6,
+            "tc": 6,
+            "id": "6.6.6",
+            "description": "Rendered from memory",
+            "test_sequences": [],
+        }
+        testcase_file = self.temp_dir / "payload_tc.yml"
+        testcase_file.write_text(yaml.dump(testcase, Dumper=YamlDumper), encoding="utf-8")
+        from_file = _TestCaseRenderer(testcase_file)
+        self.assertTrue(from_file.load_payload())
+
+        self.assertTrue(
+            from_file.render(template_path=self.testcase_template, output_file=self.temp_dir / "from_file.md")
+        )
+        self.assertTrue(
+            _TestCaseRenderer.from_payload(testcase).render(
+                template_path=self.testcase_template, output_file=self.temp_dir / "from_payload.md"
+            )
         )
 
+        rendered = (self.temp_dir / "from_payload.md").read_text(encoding="utf-8")
+        self.assertIn("Test Case: 6.6.6", rendered)
+        self.assertEqual(rendered, (self.temp_dir / "from_file.md").read_text(encoding="utf-8"))
+
+    def test_load_json_payload_keeps_exact_values(self):
+        """Test that JSON payloads keep integers wider than 64 bits and accept a UTF-8 BOM."""
+        payload_file = self.temp_dir / "payload.json"
+        payload_file.write_bytes(b'\xef\xbb\xbf{"iccid": 89049032123451234512}')
+        renderer = _TestCaseRenderer(payload_file)
+
+        self.assertTrue(renderer.load_payload())
+
+        self.assertEqual(renderer.payload, {"iccid": 89049032123451234512})
+
+    def test_render_reuses_compiled_template_string(self):
+        """Test that rendering the same inline template twice compiles it once and renders both times."""
+        template_string = "Inline {{ tc.id }}: {{ tc.description }}\n"
+        renderer = _TestCaseRenderer.from_payload({"id": "7.7.7", "description": "Inline template"})
+        hits = _compile_template_string.cache_info().hits
+
+        for name in ("first.md", "second.md"):
+            self.assertTrue(renderer.render(template_string=template_string, output_file=self.temp_dir / name))
+
+        self.assertEqual(_compile_template_string.cache_info().hits, hits + 1)
+        for name in ("first.md", "second.md"):
+            self.assertEqual((self.temp_dir / name).read_text(encoding="utf-8"), "Inline 7.7.7: Inline template")
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -5,166 +5,219 @@ import shutil
 import sys
 import tempfile
 import unittest
-from io import StringIO
+from contextlib import redirect_stdout
 from pathlib import Path
 
-sys.path.append(os.path.join(os.path.dirname(__file__), Path("..") / ".."))
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 from testplan_renderer import RendererArgs, TestPlanRendererArgsOutput, parse_and_validate_args  # noqa: E402
 
+# Static schema and data payloads, serialized once at import
+_SCHEMA_JSON = json.dumps(
+    {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "name": {"type": "string"},
+        },
+        "required": ["id", "name"],
+    }
+).encode()
+_CONTAINER_JSON = json.dumps({"id": 1, "name": "Container"}).encode()
+_TEST_CASE_JSON = json.dumps({"id": 1, "name": "Test Case"}).encode()
+_CONTAINER_YAML = b"id: 1\nname: Container\n"
+_TEST_CASE_YAML = b"id: 1\nname: Test Case\n"
+
+
+def _write_file(path, content=b""):
+    """Write fixture content with a single call instead of a text-mode file object."""
+    Path(path).write_bytes(content if isinstance(content, bytes) else content.encode())
+
+
+def _write_schema_files(directory):
+    """Write the container and test case schemas into directory and return their paths."""
+    container_schema_file = Path(directory, "container_schema.json")
+    test_case_schema_file = Path(directory, "testcase_schema.json")
+    _write_file(container_schema_file, _SCHEMA_JSON)
+    _write_file(test_case_schema_file, _SCHEMA_JSON)
+    return container_schema_file, test_case_schema_file
+
+
+def _link_file(src, dst):
+    """Give an existing fixture file a second path, falling back to a copy where hard links are unsupported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _parse(argv):
+    """Run parse_and_validate_args on argv as the command line delivers it, with every path as a str."""
+    return parse_and_validate_args([os.fspath(arg) for arg in argv])
+
+
+_fixture_dir = None
+_devnull = None
+_container_schema_file = None
+_test_case_schema_file = None
+_container_template_file = None
+_test_case_template_file = None
+
+
+def setUpModule():
+    """Create the schemas and Jinja2 templates once; no test modifies them, and parsing only reads them."""
+    global _devnull, _fixture_dir, _container_schema_file, _test_case_schema_file, _container_template_file
+    global _test_case_template_file
+    # No test inspects the progress output, so discard it instead of buffering it
+    _devnull = open(os.devnull, "w")
+    _fixture_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+    _container_schema_file, _test_case_schema_file = _write_schema_files(_fixture_dir.name)
+    _container_template_file = Path(_fixture_dir.name, "container.j2")
+    _test_case_template_file = Path(_fixture_dir.name, "testcase.j2")
+    _write_file(_container_template_file, "{{ container }}")
+    _write_file(_test_case_template_file, "{{ tc }}")
+
+
+def tearDownModule():
+    _fixture_dir.cleanup()
+    _devnull.close()
+
+
+class _ClassTempDirTestCase(unittest.TestCase):
+    """Create one scratch directory per class and give each test its own subdirectory of it."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._class_temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        cls.container_schema_file = _container_schema_file
+        cls.test_case_schema_file = _test_case_schema_file
+        cls.container_template_file = _container_template_file
+        cls.test_case_template_file = _test_case_template_file
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._class_temp_dir.cleanup()
 
-class TestParseAndValidateArgsSuccess(unittest.TestCase):
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self._create_schema_files()
-        self._create_template_files()
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-
-    def _create_schema_files(self):
-        """Create valid JSON schema files for testing."""
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "type": "object",
-            "properties": {
-                "id": {"type": "integer"},
-                "name": {"type": "string"},
-            },
-            "required": ["id", "name"],
-        }
-        self.container_schema_file = os.path.join(self.temp_dir, "container_schema.json")
-        self.test_case_schema_file = os.path.join(self.temp_dir, "testcase_schema.json")
-        with open(self.container_schema_file, "w") as f:
-            json.dump(schema, f)
-        with open(self.test_case_schema_file, "w") as f:
-            json.dump(schema, f)
-
-    def _create_template_files(self):
-        """Create valid Jinja2 template files for testing."""
-        self.container_template_file = os.path.join(self.temp_dir, "container.j2")
-        self.test_case_template_file = os.path.join(self.temp_dir, "testcase.j2")
-        with open(self.container_template_file, "w") as f:
-            f.write("{{ container }}")
-        with open(self.test_case_template_file, "w") as f:
-            f.write("{{ tc }}")
+        self.temp_dir = Path(self._class_temp_dir.name, self._testMethodName)
+        self.temp_dir.mkdir()
+        # parse_and_validate_args reports progress on stdout; keep it out of the test output
+        self.enterContext(redirect_stdout(_devnull))
 
+
+class TestParseAndValidateArgsSuccess(_ClassTempDirTestCase):
     def _create_container_data_file(self, filename="container.json"):
         """Create a valid container data file."""
-        data = {"id": 1, "name": "Test Container"}
-        container_file = os.path.join(self.temp_dir, filename)
-        with open(container_file, "w") as f:
-            json.dump(data, f)
+        container_file = self.temp_dir / filename
+        _write_file(container_file, _CONTAINER_JSON)
         return container_file
 
     def _create_test_case_data_file(self, filename="testcase.json"):
         """Create a valid test case data file."""
-        data = {"id": 1, "name": "Test Case"}
-        test_case_file = os.path.join(self.temp_dir, filename)
-        with open(test_case_file, "w") as f:
-            json.dump(data, f)
+        test_case_file = self.temp_dir / filename
+        _write_file(test_case_file, _TEST_CASE_JSON)
         return test_case_file
 
     def test_parse_valid_minimal_args(self):
-        """Test parsing with minimal required arguments."""
+        """Test parsing with minimal required arguments and the shape of the returned renderer args."""
         container_file = self._create_container_data_file()
         test_case_file = self._create_test_case_data_file()
 
-        # Suppress stdout during parsing
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-        try:
-            result = parse_and_validate_args(
-                [
-                    "--container",
-                    self.container_schema_file,
-                    self.container_template_file,
-                    container_file,
-                    "--test-case",
-                    self.test_case_schema_file,
-                    self.test_case_template_file,
-                    test_case_file,
-                ]
-            )
-        finally:
-            sys.stdout = old_stdout
+        result = _parse(
+            [
+                "--container",
+                self.container_schema_file,
+                self.container_template_file,
+                container_file,
+                "--test-case",
+                self.test_case_schema_file,
+                self.test_case_template_file,
+                test_case_file,
+            ]
+        )
 
         self.assertIsInstance(result, TestPlanRendererArgsOutput)
         self.assertIsNone(result.output_file)
         self.assertEqual(len(result.test_case_renderers), 1)
 
+        container_renderer = result.container_renderer
+        self.assertIsInstance(container_renderer, RendererArgs)
+        self.assertEqual(container_renderer.template_file, self.container_template_file)
+        self.assertEqual(container_renderer.schema_file, self.container_schema_file)
+        self.assertEqual(container_renderer.data_file, container_file)
+
+        tc_renderer = result.test_case_renderers[0]
+        self.assertIsInstance(tc_renderer, RendererArgs)
+        self.assertEqual(tc_renderer.template_file, self.test_case_template_file)
+        self.assertEqual(tc_renderer.schema_file, self.test_case_schema_file)
+        self.assertEqual(tc_renderer.data_file, test_case_file)
+
     def test_parse_with_output_file(self):
         """Test parsing with output file specified."""
         container_file = self._create_container_data_file()
         test_case_file = self._create_test_case_data_file()
-        output_file = os.path.join(self.temp_dir, "output.md")
-
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-        try:
-            result = parse_and_validate_args(
-                [
-                    "-o",
-                    output_file,
-                    "--container",
-                    self.container_schema_file,
-                    self.container_template_file,
-                    container_file,
-                    "--test-case",
-                    self.test_case_schema_file,
-                    self.test_case_template_file,
-                    test_case_file,
-                ]
-            )
-        finally:
-            sys.stdout = old_stdout
-
-        self.assertEqual(result.output_file, Path(output_file))
+        output_file = self.temp_dir / "output.md"
+
+        result = _parse(
+            [
+                "-o",
+                output_file,
+                "--container",
+                self.container_schema_file,
+                self.container_template_file,
+                container_file,
+                "--test-case",
+                self.test_case_schema_file,
+                self.test_case_template_file,
+                test_case_file,
+            ]
+        )
+
+        self.assertEqual(result.output_file, output_file)
 
     def test_parse_with_multiple_test_case_files(self):
         """Test parsing with multiple test case files."""
         container_file = self._create_container_data_file()
         test_case_file1 = self._create_test_case_data_file("testcase1.json")
-        test_case_file2 = self._create_test_case_data_file("testcase2.json")
-
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-        try:
-            result = parse_and_validate_args(
-                [
-                    "--container",
-                    self.container_schema_file,
-                    self.container_template_file,
-                    container_file,
-                    "--test-case",
-                    self.test_case_schema_file,
-                    self.test_case_template_file,
-                    test_case_file1,
-                    test_case_file2,
-                ]
-            )
-        finally:
-            sys.stdout = old_stdout
+        test_case_file2 = self.temp_dir / "testcase2.json"
+        _link_file(test_case_file1, test_case_file2)
+
+        result = _parse(
+            [
+                "--container",
+                self.container_schema_file,
+                self.container_template_file,
+                container_file,
+                "--test-case",
+                self.test_case_schema_file,
+                self.test_case_template_file,
+                test_case_file1,
+                test_case_file2,
+            ]
+        )
 
         self.assertEqual(len(result.test_case_renderers), 2)
-        self.assertEqual(result.test_case_renderers[0].data_file, Path(test_case_file1))
-        self.assertEqual(result.test_case_renderers[1].data_file, Path(test_case_file2))
-
-    def test_parse_with_yml_extension(self):
-        """Test parsing with .yml file extension."""
-        # Create YAML data files with .yml extension
-        container_file = os.path.join(self.temp_dir, "container.yml")
-        test_case_file = os.path.join(self.temp_dir, "testcase.yml")
-
-        with open(container_file, "w") as f:
-            f.write("id: 1\nname: Container\n")
-        with open(test_case_file, "w") as f:
-            f.write("id: 1\nname: Test Case\n")
-
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-        try:
-            result = parse_and_validate_args(
-                [
+        self.assertEqual(result.test_case_renderers[0].data_file, test_case_file1)
+        self.assertEqual(result.test_case_renderers[1].data_file, test_case_file2)
+
+    def test_data_file_extensions(self):
+        """Test that data files are accepted only with a lowercase .json, .yaml or .yml extension."""
+        cases = [("json", True), ("yaml", True), ("yml", True), ("JSON", False), ("YML", False), ("txt", False)]
+        for extension, accepted in cases:
+            with self.subTest(extension=extension):
+                container_file = self.temp_dir / f"container.{extension}"
+                test_case_file = self.temp_dir / f"testcase.{extension}"
+
+                if extension.lower() == "json":
+                    _write_file(container_file, _CONTAINER_JSON)
+                    _write_file(test_case_file, _TEST_CASE_JSON)
+                else:
+                    _write_file(container_file, _CONTAINER_YAML)
+                    _write_file(test_case_file, _TEST_CASE_YAML)
+
+                argv = [
                     "--container",
                     self.container_schema_file,
                     self.container_template_file,
@@ -174,516 +227,202 @@ class TestParseAndValidateArgsSuccess(unittest.TestCase):
                     self.test_case_template_file,
                     test_case_file,
                 ]
-            )
-        finally:
-            sys.stdout = old_stdout
 
-        self.assertIsInstance(result, TestPlanRendererArgsOutput)
-
-    def test_parse_container_renderer_has_correct_fields(self):
-        """Test that container renderer is properly constructed."""
-        container_file = self._create_container_data_file()
-        test_case_file = self._create_test_case_data_file()
-
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-        try:
-            result = parse_and_validate_args(
-                [
-                    "--container",
-                    self.container_schema_file,
-                    self.container_template_file,
-                    container_file,
-                    "--test-case",
-                    self.test_case_schema_file,
-                    self.test_case_template_file,
-                    test_case_file,
-                ]
-            )
-        finally:
-            sys.stdout = old_stdout
-
-        container_renderer = result.container_renderer
-        self.assertIsInstance(container_renderer, RendererArgs)
-        self.assertEqual(container_renderer.template_file, Path(self.container_template_file))
-        self.assertEqual(container_renderer.schema_file, Path(self.container_schema_file))
-        self.assertEqual(container_renderer.data_file, Path(container_file))
-
-    def test_parse_test_case_renderers_have_correct_fields(self):
-        """Test that test case renderers are properly constructed."""
-        container_file = self._create_container_data_file()
-        test_case_file = self._create_test_case_data_file()
-
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-        try:
-            result = parse_and_validate_args(
-                [
-                    "--container",
-                    self.container_schema_file,
-                    self.container_template_file,
-                    container_file,
-                    "--test-case",
-                    self.test_case_schema_file,
-                    self.test_case_template_file,
-                    test_case_file,
-                ]
-            )
-        finally:
-            sys.stdout = old_stdout
-
-        tc_renderer = result.test_case_renderers[0]
-        self.assertIsInstance(tc_renderer, RendererArgs)
-        self.assertEqual(tc_renderer.template_file, Path(self.test_case_template_file))
-        self.assertEqual(tc_renderer.schema_file, Path(self.test_case_schema_file))
-        self.assertEqual(tc_renderer.data_file, Path(test_case_file))
+                if accepted:
+                    result = _parse(argv)
+                    self.assertEqual(result.container_renderer.data_file, container_file)
+                else:
+                    with self.assertRaises(SystemExit):
+                        _parse(argv)
 
 
 class TestParseAndValidateArgsMissingRequired(unittest.TestCase):
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+    """Most of these fail inside argparse before any file is read, so only tests that need files get a temp dir."""
 
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+    def setUp(self):
+        self.enterContext(redirect_stdout(_devnull))
 
     def test_missing_container_flag(self):
         """Test that missing --container flag causes exit."""
         with self.assertRaises(SystemExit):
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            try:
-                parse_and_validate_args(
-                    [
-                        "--test-case",
-                        "schema.json",
-                        "template.j2",
-                        "testcase.json",
-                    ]
-                )
-            finally:
-                sys.stdout = old_stdout
+            _parse(
+                [
+                    "--test-case",
+                    "schema.json",
+                    "template.j2",
+                    "testcase.json",
+                ]
+            )
 
     def test_missing_test_case_flag(self):
         """Test that missing --test-case flag causes exit."""
         with self.assertRaises(SystemExit):
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            try:
-                parse_and_validate_args(
-                    [
-                        "--container",
-                        "schema.json",
-                        "template.j2",
-                        "container.json",
-                    ]
-                )
-            finally:
-                sys.stdout = old_stdout
+            _parse(
+                [
+                    "--container",
+                    "schema.json",
+                    "template.j2",
+                    "container.json",
+                ]
+            )
 
     def test_container_missing_file_args(self):
         """Test that --container requires exactly 3 arguments."""
         with self.assertRaises(SystemExit):
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            try:
-                parse_and_validate_args(
-                    [
-                        "--container",
-                        "schema.json",
-                        "template.j2",
-                        "--test-case",
-                        "schema.json",
-                        "template.j2",
-                        "testcase.json",
-                    ]
-                )
-            finally:
-                sys.stdout = old_stdout
+            _parse(
+                [
+                    "--container",
+                    "schema.json",
+                    "template.j2",
+                    "--test-case",
+                    "schema.json",
+                    "template.j2",
+                    "testcase.json",
+                ]
+            )
 
     def test_test_case_missing_minimum_files(self):
         """Test that --test-case requires at least schema, template, and one data file."""
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "type": "object",
-            "properties": {"id": {"type": "integer"}},
-            "required": ["id"],
-        }
-        container_schema = os.path.join(self.temp_dir, "container_schema.json")
-        test_case_schema = os.path.join(self.temp_dir, "testcase_schema.json")
-        container_template = os.path.join(self.temp_dir, "container.j2")
-        test_case_template = os.path.join(self.temp_dir, "testcase.j2")
-        container_file = os.path.join(self.temp_dir, "container.json")
-
-        with open(container_schema, "w") as f:
-            json.dump(schema, f)
-        with open(test_case_schema, "w") as f:
-            json.dump(schema, f)
-        with open(container_template, "w") as f:
-            f.write("{{ container }}")
-        with open(test_case_template, "w") as f:
-            f.write("{{ tc }}")
-        with open(container_file, "w") as f:
-            json.dump({"id": 1}, f)
+        temp_dir = Path(self.enterContext(tempfile.TemporaryDirectory(ignore_cleanup_errors=True)))
+        container_file = temp_dir / "container.json"
+        _write_file(container_file, _CONTAINER_JSON)
 
         with self.assertRaises(SystemExit):
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            try:
-                parse_and_validate_args(
-                    [
-                        "--container",
-                        container_schema,
-                        container_template,
-                        container_file,
-                        "--test-case",
-                        test_case_schema,
-                        test_case_template,
-                    ]
-                )
-            finally:
-                sys.stdout = old_stdout
-
-
-class TestParseAndValidateArgsFileValidation(unittest.TestCase):
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self._create_schema_files()
-        self._create_template_files()
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-
-    def _create_schema_files(self):
-        """Create valid JSON schema files for testing."""
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "type": "object",
-            "properties": {
-                "id": {"type": "integer"},
-                "name": {"type": "string"},
-            },
-            "required": ["id", "name"],
-        }
-        self.container_schema_file = os.path.join(self.temp_dir, "container_schema.json")
-        self.test_case_schema_file = os.path.join(self.temp_dir, "testcase_schema.json")
-        with open(self.container_schema_file, "w") as f:
-            json.dump(schema, f)
-        with open(self.test_case_schema_file, "w") as f:
-            json.dump(schema, f)
-
-    def _create_template_files(self):
-        """Create valid Jinja2 template files for testing."""
-        self.container_template_file = os.path.join(self.temp_dir, "container.j2")
-        self.test_case_template_file = os.path.join(self.temp_dir, "testcase.j2")
-        with open(self.container_template_file, "w") as f:
-            f.write("{{ container }}")
-        with open(self.test_case_template_file, "w") as f:
-            f.write("{{ tc }}")
+            _parse(
+                [
+                    "--container",
+                    _container_schema_file,
+                    _container_template_file,
+                    container_file,
+                    "--test-case",
+                    _test_case_schema_file,
+                    _test_case_template_file,
+                ]
+            )
+
 
+class TestParseAndValidateArgsFileValidation(_ClassTempDirTestCase):
     def test_nonexistent_container_file(self):
         """Test error when container data file doesn't exist."""
         with self.assertRaises(AssertionError) as context:
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            try:
-                parse_and_validate_args(
-                    [
-                        "--container",
-                        self.container_schema_file,
-                        self.container_template_file,
-                        "/nonexistent/container.json",
-                        "--test-case",
-                        self.test_case_schema_file,
-                        self.test_case_template_file,
-                        "/nonexistent/testcase.json",
-                    ]
-                )
-            finally:
-                sys.stdout = old_stdout
+            _parse(
+                [
+                    "--container",
+                    self.container_schema_file,
+                    self.container_template_file,
+                    "/nonexistent/container.json",
+                    "--test-case",
+                    self.test_case_schema_file,
+                    self.test_case_template_file,
+                    "/nonexistent/testcase.json",
+                ]
+            )
         self.assertIn("Container file not found", str(context.exception))
 
     def test_nonexistent_test_case_file(self):
         """Test error when test case data file doesn't exist."""
-        container_data = {"id": 1, "name": "Container"}
-        container_file = os.path.join(self.temp_dir, "container.json")
-        with open(container_file, "w") as f:
-            json.dump(container_data, f)
+        container_file = self.temp_dir / "container.json"
+        _write_file(container_file, _CONTAINER_JSON)
 
         with self.assertRaises(AssertionError) as context:
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            try:
-                parse_and_validate_args(
-                    [
-                        "--container",
-                        self.container_schema_file,
-                        self.container_template_file,
-                        container_file,
-                        "--test-case",
-                        self.test_case_schema_file,
-                        self.test_case_template_file,
-                        "/nonexistent/testcase.json",
-                    ]
-                )
-            finally:
-                sys.stdout = old_stdout
+            _parse(
+                [
+                    "--container",
+                    self.container_schema_file,
+                    self.container_template_file,
+                    container_file,
+                    "--test-case",
+                    self.test_case_schema_file,
+                    self.test_case_template_file,
+                    "/nonexistent/testcase.json",
+                ]
+            )
         self.assertIn("File not found", str(context.exception))
 
     def test_nonexistent_container_template(self):
         """Test error when container template file doesn't exist."""
-        container_data = {"id": 1, "name": "Container"}
-        test_case_data = {"id": 1, "name": "Test Case"}
-        container_file = os.path.join(self.temp_dir, "container.json")
-        test_case_file = os.path.join(self.temp_dir, "testcase.json")
-        with open(container_file, "w") as f:
-            json.dump(container_data, f)
-        with open(test_case_file, "w") as f:
-            json.dump(test_case_data, f)
+        container_file = self.temp_dir / "container.json"
+        test_case_file = self.temp_dir / "testcase.json"
+        _write_file(container_file, _CONTAINER_JSON)
+        _write_file(test_case_file, _TEST_CASE_JSON)
 
         with self.assertRaises(AssertionError) as context:
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            try:
-                parse_and_validate_args(
-                    [
-                        "--container",
-                        self.container_schema_file,
-                        "/nonexistent/container.j2",
-                        container_file,
-                        "--test-case",
-                        self.test_case_schema_file,
-                        self.test_case_template_file,
-                        test_case_file,
-                    ]
-                )
-            finally:
-                sys.stdout = old_stdout
+            _parse(
+                [
+                    "--container",
+                    self.container_schema_file,
+                    "/nonexistent/container.j2",
+                    container_file,
+                    "--test-case",
+                    self.test_case_schema_file,
+                    self.test_case_template_file,
+                    test_case_file,
+                ]
+            )
         self.assertIn("Container file not found", str(context.exception))
 
     def test_nonexistent_container_schema(self):
         """Test error when container schema file doesn't exist."""
-        container_data = {"id": 1, "name": "Container"}
-        test_case_data = {"id": 1, "name": "Test Case"}
-        container_file = os.path.join(self.temp_dir, "container.json")
-        test_case_file = os.path.join(self.temp_dir, "testcase.json")
-        with open(container_file, "w") as f:
-            json.dump(container_data, f)
-        with open(test_case_file, "w") as f:
-            json.dump(test_case_data, f)
+        container_file = self.temp_dir / "container.json"
+        test_case_file = self.temp_dir / "testcase.json"
+        _write_file(container_file, _CONTAINER_JSON)
+        _write_file(test_case_file, _TEST_CASE_JSON)
 
         with self.assertRaises(AssertionError) as context:
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            try:
-                parse_and_validate_args(
-                    [
-                        "--container",
-                        "/nonexistent/schema.json",
-                        self.container_template_file,
-                        container_file,
-                        "--test-case",
-                        self.test_case_schema_file,
-                        self.test_case_template_file,
-                        test_case_file,
-                    ]
-                )
-            finally:
-                sys.stdout = old_stdout
+            _parse(
+                [
+                    "--container",
+                    "/nonexistent/schema.json",
+                    self.container_template_file,
+                    container_file,
+                    "--test-case",
+                    self.test_case_schema_file,
+                    self.test_case_template_file,
+                    test_case_file,
+                ]
+            )
         self.assertIn("Container file not found", str(context.exception))
 
     def test_invalid_container_data_format(self):
         """Test error when container data file is invalid format."""
-        container_data = {"id": 1, "name": "Container"}
-        test_case_data = {"id": 1, "name": "Test Case"}
-        invalid_file = os.path.join(self.temp_dir, "invalid.txt")
-        test_case_file = os.path.join(self.temp_dir, "testcase.json")
-        container_file = os.path.join(self.temp_dir, "container.json")
-
-        with open(invalid_file, "w") as f:
-            f.write("invalid content")
-        with open(test_case_file, "w") as f:
-            json.dump(test_case_data, f)
-        with open(container_file, "w") as f:
-            json.dump(container_data, f)
-
-        with self.assertRaises(SystemExit):
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            try:
-                parse_and_validate_args(
-                    [
-                        "--container",
-                        self.container_schema_file,
-                        self.container_template_file,
-                        invalid_file,
-                        "--test-case",
-                        self.test_case_schema_file,
-                        self.test_case_template_file,
-                        test_case_file,
-                    ]
-                )
-            finally:
-                sys.stdout = old_stdout
+        invalid_file = self.temp_dir / "invalid.txt"
+        test_case_file = self.temp_dir / "testcase.json"
+        container_file = self.temp_dir / "container.json"
 
-    def test_invalid_template_extension(self):
-        """Test error when template file doesn't have .j2 extension."""
-        container_data = {"id": 1, "name": "Container"}
-        test_case_data = {"id": 1, "name": "Test Case"}
-        container_file = os.path.join(self.temp_dir, "container.json")
-        test_case_file = os.path.join(self.temp_dir, "testcase.json")
-        invalid_template = os.path.join(self.temp_dir, "template.txt")
-
-        with open(container_file, "w") as f:
-            json.dump(container_data, f)
-        with open(test_case_file, "w") as f:
-            json.dump(test_case_data, f)
-        with open(invalid_template, "w") as f:
-            f.write("invalid template")
+        _write_file(invalid_file, "invalid content")
+        _write_file(test_case_file, _TEST_CASE_JSON)
+        _write_file(container_file, _CONTAINER_JSON)
 
         with self.assertRaises(SystemExit):
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            try:
-                parse_and_validate_args(
-                    [
-                        "--container",
-                        self.container_schema_file,
-                        invalid_template,
-                        container_file,
-                        "--test-case",
-                        self.test_case_schema_file,
-                        self.test_case_template_file,
-                        test_case_file,
-                    ]
-                )
-            finally:
-                sys.stdout = old_stdout
-
-
-class TestParseAndValidateArgsEdgeCases(unittest.TestCase):
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self._create_schema_files()
-        self._create_template_files()
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-
-    def _create_schema_files(self):
-        """Create valid JSON schema files for testing."""
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "type": "object",
-            "properties": {
-                "id": {"type": "integer"},
-                "name": {"type": "string"},
-            },
-            "required": ["id", "name"],
-        }
-        self.container_schema_file = os.path.join(self.temp_dir, "container_schema.json")
-        self.test_case_schema_file = os.path.join(self.temp_dir, "testcase_schema.json")
-        with open(self.container_schema_file, "w") as f:
-            json.dump(schema, f)
-        with open(self.test_case_schema_file, "w") as f:
-            json.dump(schema, f)
-
-    def _create_template_files(self):
-        """Create valid Jinja2 template files for testing."""
-        self.container_template_file = os.path.join(self.temp_dir, "container.j2")
-        self.test_case_template_file = os.path.join(self.temp_dir, "testcase.j2")
-        with open(self.container_template_file, "w") as f:
-            f.write("{{ container }}")
-        with open(self.test_case_template_file, "w") as f:
-            f.write("{{ tc }}")
-
-    def test_duplicate_test_case_files(self):
-        """Test error when duplicate test case files are provided."""
-        container_data = {"id": 1, "name": "Container"}
-        test_case_data = {"id": 1, "name": "Test Case"}
-        container_file = os.path.join(self.temp_dir, "container.json")
-        test_case_file = os.path.join(self.temp_dir, "testcase.json")
-
-        with open(container_file, "w") as f:
-            json.dump(container_data, f)
-        with open(test_case_file, "w") as f:
-            json.dump(test_case_data, f)
-
-        with self.assertRaises(AssertionError) as context:
-            old_stdout = sys.stdout
-            sys.stdout = StringIO()
-            try:
-                parse_and_validate_args(
-                    [
-                        "--container",
-                        self.container_schema_file,
-                        self.container_template_file,
-                        container_file,
-                        "--test-case",
-                        self.test_case_schema_file,
-                        self.test_case_template_file,
-                        test_case_file,
-                        test_case_file,  # Same file twice
-                    ]
-                )
-            finally:
-                sys.stdout = old_stdout
-        self.assertIn("Duplicate test case files", str(context.exception))
-
-    def test_output_file_with_spaces(self):
-        """Test output file path with spaces."""
-        container_data = {"id": 1, "name": "Container"}
-        test_case_data = {"id": 1, "name": "Test Case"}
-        container_file = os.path.join(self.temp_dir, "container.json")
-        test_case_file = os.path.join(self.temp_dir, "testcase.json")
-        output_file = os.path.join(self.temp_dir, "output with spaces.md")
-
-        with open(container_file, "w") as f:
-            json.dump(container_data, f)
-        with open(test_case_file, "w") as f:
-            json.dump(test_case_data, f)
-
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-        try:
-            result = parse_and_validate_args(
+            _parse(
                 [
-                    "-o",
-                    output_file,
                     "--container",
                     self.container_schema_file,
                     self.container_template_file,
-                    container_file,
+                    invalid_file,
                     "--test-case",
                     self.test_case_schema_file,
                     self.test_case_template_file,
                     test_case_file,
                 ]
             )
-        finally:
-            sys.stdout = old_stdout
-
-        self.assertEqual(result.output_file, Path(output_file))
-
-    def test_file_paths_with_special_characters(self):
-        """Test file paths with special characters."""
-        container_data = {"id": 1, "name": "Container"}
-        test_case_data = {"id": 1, "name": "Test Case"}
-        container_file = os.path.join(self.temp_dir, "container-v1.0_test.json")
-        test_case_file = os.path.join(self.temp_dir, "testcase-v1.0_test.json")
-
-        with open(container_file, "w") as f:
-            json.dump(container_data, f)
-        with open(test_case_file, "w") as f:
-            json.dump(test_case_data, f)
-
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-        try:
-            result = parse_and_validate_args(
+
+    def test_invalid_template_extension(self):
+        """Test error when template file doesn't have .j2 extension."""
+        container_file = self.temp_dir / "container.json"
+        test_case_file = self.temp_dir / "testcase.json"
+        invalid_template = self.temp_dir / "template.txt"
+
+        _write_file(container_file, _CONTAINER_JSON)
+        _write_file(test_case_file, _TEST_CASE_JSON)
+        _write_file(invalid_template, "invalid template")
+
+        with self.assertRaises(SystemExit):
+            _parse(
                 [
                     "--container",
                     self.container_schema_file,
-                    self.container_template_file,
+                    invalid_template,
                     container_file,
                     "--test-case",
                     self.test_case_schema_file,
@@ -691,30 +430,19 @@ class TestParseAndValidateArgsEdgeCases(unittest.TestCase):
                     test_case_file,
                 ]
             )
-        finally:
-            sys.stdout = old_stdout
 
-        self.assertIsInstance(result, TestPlanRendererArgsOutput)
 
-    def test_three_test_case_files(self):
-        """Test with three test case files."""
-        container_data = {"id": 1, "name": "Container"}
-        test_case_data = {"id": 1, "name": "Test Case"}
-        container_file = os.path.join(self.temp_dir, "container.json")
-        test_case_file1 = os.path.join(self.temp_dir, "testcase1.json")
-        test_case_file2 = os.path.join(self.temp_dir, "testcase2.json")
-        test_case_file3 = os.path.join(self.temp_dir, "testcase3.json")
-
-        with open(container_file, "w") as f:
-            json.dump(container_data, f)
-        for f in [test_case_file1, test_case_file2, test_case_file3]:
-            with open(f, "w") as file:
-                json.dump(test_case_data, file)
-
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-        try:
-            result = parse_and_validate_args(
+class TestParseAndValidateArgsEdgeCases(_ClassTempDirTestCase):
+    def test_duplicate_test_case_files(self):
+        """Test error when duplicate test case files are provided."""
+        container_file = self.temp_dir / "container.json"
+        test_case_file = self.temp_dir / "testcase.json"
+
+        _write_file(container_file, _CONTAINER_JSON)
+        _write_file(test_case_file, _TEST_CASE_JSON)
+
+        with self.assertRaises(AssertionError) as context:
+            _parse(
                 [
                     "--container",
                     self.container_schema_file,
@@ -723,68 +451,110 @@ class TestParseAndValidateArgsEdgeCases(unittest.TestCase):
                     "--test-case",
                     self.test_case_schema_file,
                     self.test_case_template_file,
-                    test_case_file1,
-                    test_case_file2,
-                    test_case_file3,
+                    test_case_file,
+                    test_case_file,  # Same file twice
                 ]
             )
-        finally:
-            sys.stdout = old_stdout
+        self.assertIn("Duplicate test case files", str(context.exception))
+
+    def _assert_file_names_accepted(self, suffix):
+        container_file = self.temp_dir / f"container{suffix}.json"
+        test_case_file = self.temp_dir / f"testcase{suffix}.json"
+        output_file = self.temp_dir / f"output{suffix}.md"
+
+        _write_file(container_file, _CONTAINER_JSON)
+        _write_file(test_case_file, _TEST_CASE_JSON)
+
+        result = _parse(
+            [
+                "-o",
+                output_file,
+                "--container",
+                self.container_schema_file,
+                self.container_template_file,
+                container_file,
+                "--test-case",
+                self.test_case_schema_file,
+                self.test_case_template_file,
+                test_case_file,
+            ]
+        )
+
+        self.assertEqual(result.output_file, output_file)
+        self.assertEqual(result.container_renderer.data_file, container_file)
+        self.assertEqual(result.test_case_renderers[0].data_file, test_case_file)
+
+    def test_file_names_with_special_characters(self):
+        """Test data and output file names with spaces and special characters."""
+        for suffix in [" with spaces", "-v1.0_test", ".json.backup"]:
+            with self.subTest(suffix=suffix):
+                self._assert_file_names_accepted(suffix)
+
+    @unittest.skipUnless(sys.getfilesystemencoding().lower().startswith("utf"), "file system encoding is not UTF")
+    def test_file_names_with_unicode_characters(self):
+        """Test data and output file names with non-ASCII characters."""
+        self._assert_file_names_accepted("_测试")
+
+    def test_three_test_case_files(self):
+        """Test with three test case files."""
+        container_file = self.temp_dir / "container.json"
+        test_case_file1 = self.temp_dir / "testcase1.json"
+        test_case_file2 = self.temp_dir / "testcase2.json"
+        test_case_file3 = self.temp_dir / "testcase3.json"
+
+        _write_file(container_file, _CONTAINER_JSON)
+        _write_file(test_case_file1, _TEST_CASE_JSON)
+        _link_file(test_case_file1, test_case_file2)
+        _link_file(test_case_file1, test_case_file3)
+
+        result = _parse(
+            [
+                "--container",
+                self.container_schema_file,
+                self.container_template_file,
+                container_file,
+                "--test-case",
+                self.test_case_schema_file,
+                self.test_case_template_file,
+                test_case_file1,
+                test_case_file2,
+                test_case_file3,
+            ]
+        )
 
         self.assertEqual(len(result.test_case_renderers), 3)
 
     def test_nested_directory_paths(self):
         """Test with nested directory paths."""
-        nested_dir = os.path.join(self.temp_dir, "nested", "deep", "path")
-        os.makedirs(nested_dir, exist_ok=True)
-
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "type": "object",
-            "properties": {
-                "id": {"type": "integer"},
-                "name": {"type": "string"},
-            },
-            "required": ["id", "name"],
-        }
-
-        container_schema = os.path.join(nested_dir, "container_schema.json")
-        test_case_schema = os.path.join(nested_dir, "testcase_schema.json")
-        container_template = os.path.join(nested_dir, "container.j2")
-        test_case_template = os.path.join(nested_dir, "testcase.j2")
-        container_file = os.path.join(nested_dir, "container.json")
-        test_case_file = os.path.join(nested_dir, "testcase.json")
-
-        with open(container_schema, "w") as f:
-            json.dump(schema, f)
-        with open(test_case_schema, "w") as f:
-            json.dump(schema, f)
-        with open(container_template, "w") as f:
-            f.write("{{ container }}")
-        with open(test_case_template, "w") as f:
-            f.write("{{ tc }}")
-        with open(container_file, "w") as f:
-            json.dump({"id": 1, "name": "Container"}, f)
-        with open(test_case_file, "w") as f:
-            json.dump({"id": 1, "name": "Test Case"}, f)
-
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-        try:
-            result = parse_and_validate_args(
-                [
-                    "--container",
-                    container_schema,
-                    container_template,
-                    container_file,
-                    "--test-case",
-                    test_case_schema,
-                    test_case_template,
-                    test_case_file,
-                ]
-            )
-        finally:
-            sys.stdout = old_stdout
+        nested_dir = self.temp_dir / "nested" / "deep" / "path"
+        nested_dir.mkdir(parents=True)
+
+        container_schema = nested_dir / "container_schema.json"
+        test_case_schema = nested_dir / "testcase_schema.json"
+        container_template = nested_dir / "container.j2"
+        test_case_template = nested_dir / "testcase.j2"
+        container_file = nested_dir / "container.json"
+        test_case_file = nested_dir / "testcase.json"
+
+        _link_file(self.container_schema_file, container_schema)
+        _link_file(self.test_case_schema_file, test_case_schema)
+        _link_file(self.container_template_file, container_template)
+        _link_file(self.test_case_template_file, test_case_template)
+        _write_file(container_file, _CONTAINER_JSON)
+        _write_file(test_case_file, _TEST_CASE_JSON)
+
+        result = _parse(
+            [
+                "--container",
+                container_schema,
+                container_template,
+                container_file,
+                "--test-case",
+                test_case_schema,
+                test_case_template,
+                test_case_file,
+            ]
+        )
 
         self.assertIsInstance(result, TestPlanRendererArgsOutput)
 
@@ -3,6 +3,8 @@ import re
 import sys
 from typing import Dict, List, Optional, Tuple
 
+_PIPE_RE = re.compile(r":\s*\|")
+
 
 class YamlReindenter:
     def __init__(self, yaml_file: str) -> None:
@@ -25,7 +27,7 @@ class YamlReindenter:
     def detect_pipe_blocks(self) -> List[Dict[str, any]]:
         blocks = []
         for i, line in enumerate(self.lines):
-            if re.search(r":\s*\|", line):
+            if _PIPE_RE.search(line):
                 indent = len(line) - len(line.lstrip())
                 blocks.append({"line_num": i, "pipe_indent": indent, "key_line": line})
         return blocks
@@ -82,8 +84,9 @@ class YamlReindenter:
                 all_issues.extend(issues)
         return all_issues
 
-    def reindent(self) -> bool:
-        issues = self.analyze()
+    def reindent(self, issues: Optional[List[Dict[str, int]]] = None) -> bool:
+        if issues is None:
+            issues = self.analyze()
         if not issues:
             return False
         return self.fix_indentation(issues)
@@ -123,7 +126,7 @@ def main() -> None:
     print(f"Found {len(issues)} indentation issue(s)")
     for issue in issues:
         print(f"  Line {issue['line_num'] + 1}: {issue['current_indent']} spaces -> {issue['expected_indent']} spaces")
-    if reindenter.reindent():
+    if reindenter.reindent(issues):
         if reindenter.save_file(output_file):
             print("Reindentation completed successfully")
         else:
@@ -1,5 +1,6 @@
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -10,25 +11,45 @@ except ImportError:
     sys.exit(1)
 
 try:
-    from jsonschema import SchemaError, ValidationError, validate
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    from jsonschema import SchemaError
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
 except ImportError:
     print("Error: jsonschema library is required. Install with: uv add jsonschema, or uv sync")
     sys.exit(1)
 
 
+@lru_cache(maxsize=32)
+def _compiled_validator(schema_json: str):
+    """Check and compile a schema once per distinct content; the validator works on its own copy of the schema."""
+    schema = json.loads(schema_json)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def _schema_validator(schema: Any):
+    """Return the validator for the schema's current content, so edits to the schema are always checked again."""
+    # Keys stay in schema order: it decides the order iter_errors reports errors in
+    return _compiled_validator(json.dumps(schema))
+
+
 class YamlSchemaValidator:
     @staticmethod
     def load_json_schema(path_: Path) -> tuple[bool, Any]:
-        with Path.open(path_) as json_schema_file:
+        with Path.open(path_, "rb") as json_schema_file:
             try:
-                lines = [line.strip() for line in json_schema_file.readlines()]
+                raw = json_schema_file.read()
             except Exception as e:
                 print("Error reading JSON schema file:", e)
                 sys.exit(1)
-        json_schema_contents = "".join(lines)
         try:
-            json_schema = json.loads(json_schema_contents)
-            return True, json_schema
+            return True, json.loads(raw)
         except Exception as e:
             print("Error parsing JSON schema:", e)
         return False, None
@@ -44,43 +65,44 @@ class YamlSchemaValidator:
         self.schema = schema_object
 
     def load_yaml(self):
-        t = None
         try:
-            t = open(self.yaml_file)
-            self.data = yaml.safe_load(t)
+            with open(self.yaml_file, "rb") as f:
+                self.data = yaml.load(f, Loader=YamlLoader)
             return True
         except FileNotFoundError:
             print(f"Error: File '{self.yaml_file}' not found")
         except yaml.YAMLError as e:
             print(f"Error parsing YAML: {e}")
-        finally:
-            if t:
-                t.close()
         return False
 
-    def validate(self):
+    def validate(self, fail_fast: bool = False):
+        """
+        Report the most relevant schema violation, or with fail_fast the first one found, which avoids walking the
+        whole document when only the verdict matters.
+        """
         if not self.data:
             print("Error: No data loaded. Call load_yaml() first.")
             return False
         try:
-            validate(instance=self.data, schema=self.schema)
-            return True
-        except ValidationError as e:
-            print(f"Validation Error: {e.message}")
-            print(f"Failed at: {' -> '.join(str(p) for p in e.path) if e.path else 'root'}")
-            if e.schema_path:
-                print(f"Schema path: {' -> '.join(str(p) for p in e.schema_path)}")
-            return False
+            errors = _schema_validator(self.schema).iter_errors(self.data)
+            error = next(errors, None) if fail_fast else best_match(errors)
         except SchemaError as e:
             print(f"Schema Error: {e.message}")
             return False
+        if error is None:
+            return True
+        print(f"Validation Error: {error.message}")
+        print(f"Failed at: {' -> '.join(map(str, error.path)) if error.path else 'root'}")
+        if error.schema_path:
+            print(f"Schema path: {' -> '.join(map(str, error.schema_path))}")
+        return False
 
-    def validate_and_report(self):
+    def validate_and_report(self, fail_fast: bool = False):
         print(f"Validating: {self.yaml_file}")
         print("-" * 80)
         if not self.load_yaml():
             return False
-        if self.validate():
+        if self.validate(fail_fast):
             print("✓ Validation successful")
             print(f"\nFile '{self.yaml_file}' is valid according to the test case schema.")
             return True